@@ -0,0 +1,318 @@
+import pickle
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Signed integer types tried, smallest first, when packing walk steps
+_INT_TYPES = (np.int8, np.int16, np.int32, np.int64)
+
+# Tokens of an SVG path "d" attribute: commands and (signed) numbers
+_SVG_TOKEN = re.compile(r"[MmLl]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+def _encode(values: list[float]) -> tuple[np.ndarray, bool]:
+    """Encode walk values for storage.
+
+    Integer walks are delta encoded: the first item is the starting
+    value and every following item is the step taken from the previous
+    point. Since steps are bounded by the walk's distance lists, they
+    are packed into the smallest signed integer type that holds them.
+    Non-integer walks are stored as raw float64 values, because summing
+    float steps back up would not reproduce the original values exactly.
+
+    Returns:
+        A tuple containing the encoded array and whether it holds
+        delta encoded steps.
+    """
+    array = np.asarray(values)
+    if array.dtype.kind not in "iu":
+        return array.astype(np.float64), False
+
+    steps = np.diff(array.astype(np.int64), prepend=0)
+    if steps.size == 0:
+        return steps.astype(np.int8), True
+
+    low, high = steps.min(), steps.max()
+    for int_type in _INT_TYPES:
+        info = np.iinfo(int_type)
+        if info.min <= low and high <= info.max:
+            return steps.astype(int_type), True
+    return steps, True
+
+
+def _decode(array: np.ndarray, delta: bool) -> list[float]:
+    """Reverse `_encode()` and return the walk values as a list."""
+    if delta:
+        return np.cumsum(array, dtype=np.int64).tolist()
+    return array.tolist()
+
+
+def save_npz(path: str | Path, x_values: list[float], y_values: list[float]) -> None:
+    """Save walk values to a compressed NumPy `.npz` file.
+
+    Arguments:
+        path (str | Path):
+            Destination file. NumPy appends ".npz" if it is missing.
+
+        x_values (list[float]):
+            The x values of the walk, as returned by
+            `RandomWalk.build()`.
+
+        y_values (list[float]):
+            The y values of the walk.
+    """
+    x_array, x_delta = _encode(x_values)
+    y_array, y_delta = _encode(y_values)
+    np.savez_compressed(
+        path,
+        x=x_array,
+        y=y_array,
+        delta=np.array([x_delta, y_delta]),
+    )
+
+
+def load_npz(path: str | Path) -> tuple[list[float], list[float]]:
+    """Load walk values saved with `save_npz()`.
+
+    Returns:
+        A tuple containing the x values and y values of the walk.
+    """
+    with np.load(path) as data:
+        x_delta, y_delta = data["delta"].tolist()
+        return _decode(data["x"], x_delta), _decode(data["y"], y_delta)
+
+
+def save_parquet(path: str | Path, x_values: list[float], y_values: list[float]) -> None:
+    """Save walk values to a zstd compressed Parquet file.
+
+    Requires the optional `pyarrow` package.
+
+    Arguments:
+        path (str | Path):
+            Destination file.
+
+        x_values (list[float]):
+            The x values of the walk, as returned by
+            `RandomWalk.build()`.
+
+        y_values (list[float]):
+            The y values of the walk.
+
+    Raises:
+        ImportError:
+            If `pyarrow` is not installed.
+    """
+    pa, pq = _import_pyarrow()
+
+    x_array, x_delta = _encode(x_values)
+    y_array, y_delta = _encode(y_values)
+    table = pa.table({"x": x_array, "y": y_array})
+    table = table.replace_schema_metadata({
+        "x_delta": str(x_delta),
+        "y_delta": str(y_delta),
+    })
+    pq.write_table(table, path, compression="zstd")
+
+
+def load_parquet(path: str | Path) -> tuple[list[float], list[float]]:
+    """Load walk values saved with `save_parquet()`.
+
+    Requires the optional `pyarrow` package.
+
+    Returns:
+        A tuple containing the x values and y values of the walk.
+
+    Raises:
+        ImportError:
+            If `pyarrow` is not installed.
+    """
+    _, pq = _import_pyarrow()
+
+    table = pq.read_table(path)
+    metadata = table.schema.metadata
+    x_delta = metadata[b"x_delta"] == b"True"
+    y_delta = metadata[b"y_delta"] == b"True"
+    return (
+        _decode(table.column("x").to_numpy(), x_delta),
+        _decode(table.column("y").to_numpy(), y_delta),
+    )
+
+
+def _import_pyarrow():
+    """Import `pyarrow` and its Parquet module, which are optional."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Parquet export requires 'pyarrow'. "
+                          "Install it with 'pip install pyarrow'") from e
+    return pyarrow, pyarrow.parquet
+
+
+def save_svg(path: str | Path,
+             x_values: list[float],
+             y_values: list[float],
+             stroke: str = "black",
+             stroke_width: float = 1,
+             margin: float = 10) -> None:
+    """Save the walk as a single SVG path.
+
+    The whole walk is written as one `<path>` element, avoiding the
+    per-point artist cost of drawing it with matplotlib. Integer walks
+    use relative line commands, so each point is written as its step
+    from the previous point. The SVG y-axis points down, so y values
+    are negated to keep the walk the same way up as the graph.
+
+    Arguments:
+        path (str | Path):
+            Destination file.
+
+        x_values (list[float]):
+            The x values of the walk, as returned by
+            `RandomWalk.build()`.
+
+        y_values (list[float]):
+            The y values of the walk.
+
+        stroke (str, optional):
+            Color of the path.
+
+        stroke_width (float, optional):
+            Width of the path, in walk units.
+
+        margin (float, optional):
+            Space left around the walk, in walk units.
+
+    Raises:
+        ValueError:
+            If the walk has no points or the x and y values differ in
+            length.
+    """
+    if not x_values or len(x_values) != len(y_values):
+        raise ValueError("Walk must have at least one point and the same "
+                         "number of x and y values")
+
+    x_array, x_delta = _encode(x_values)
+    y_array, y_delta = _encode(y_values)
+    if x_delta and y_delta:
+        command = "l"
+        xs, ys = x_array.tolist(), (-y_array).tolist()
+    else:
+        command = "L"
+        xs = [float(x) for x in x_values]
+        ys = [-float(y) for y in y_values]
+
+    coords = " ".join(f"{x!r} {y!r}" for x, y in zip(xs[1:], ys[1:]))
+    d = f"M{xs[0]!r} {ys[0]!r}"
+    if coords:
+        d += f"{command}{coords}"
+
+    min_x, max_x = min(x_values), max(x_values)
+    min_y, max_y = -max(y_values), -min(y_values)
+    view_box = (f"{min_x - margin} {min_y - margin} "
+                f"{max_x - min_x + 2 * margin} {max_y - min_y + 2 * margin}")
+
+    svg = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{view_box}">'
+        f'<path d="{d}" fill="none" stroke="{stroke}" '
+        f'stroke-width="{stroke_width}" stroke-linejoin="round"/>'
+        f'</svg>\n'
+    )
+    Path(path).write_text(svg, encoding="utf-8")
+
+
+def load_svg(path: str | Path) -> tuple[list[float], list[float]]:
+    """Load walk values saved with `save_svg()`.
+
+    Returns:
+        A tuple containing the x values and y values of the walk.
+
+    Raises:
+        ValueError:
+            If the file has no path written by `save_svg()`.
+    """
+    match = re.search(r'<path d="([^"]*)"', Path(path).read_text(encoding="utf-8"))
+    if match is None:
+        raise ValueError(f"No walk path found in '{path}'")
+
+    x_values, y_values = [], []
+    command = None
+    pending = []
+    for token in _SVG_TOKEN.findall(match.group(1)):
+        if token in "MmLl":
+            command = token
+            continue
+
+        pending.append(float(token) if any(c in token for c in ".eE") else int(token))
+        if len(pending) < 2:
+            continue
+
+        x, y = pending[0], -pending[1]
+        pending = []
+        if command == "l" and x_values:
+            x += x_values[-1]
+            y += y_values[-1]
+        x_values.append(x)
+        y_values.append(y)
+
+    return x_values, y_values
+
+
+def benchmark(steps: int = 500_000, repeat: int = 3, directory: str | Path = ".") -> None:
+    """Compare export formats with pickled lists.
+
+    Prints the file size and the best write and read times of each
+    format for a walk of `steps` points. Parquet is skipped if
+    `pyarrow` is not installed.
+    """
+    from rw_generator import RWGenerator
+
+    rwg = RWGenerator()
+    rwg.steps = steps
+    rwg.fill_walk()
+    values = (rwg.x_values, rwg.y_values)
+
+    def save_pickle(path, x, y):
+        with open(path, "wb") as f:
+            pickle.dump((x, y), f)
+
+    def load_pickle(path):
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    formats = [
+        ("pickle", "walk.pkl", save_pickle, load_pickle),
+        ("npz", "walk.npz", save_npz, load_npz),
+        ("parquet", "walk.parquet", save_parquet, load_parquet),
+        ("svg", "walk.svg", save_svg, load_svg),
+    ]
+
+    print(f"{'format':<10}{'size (KiB)':>12}{'write (ms)':>12}{'read (ms)':>12}")
+    for name, filename, save, load in formats:
+        path = Path(directory) / filename
+        try:
+            write_time = min(_time(save, path, *values) for _ in range(repeat))
+        except ImportError:
+            print(f"{name:<10}{'skipped':>12}")
+            continue
+        read_time = min(_time(load, path) for _ in range(repeat))
+
+        if tuple(load(path)) != values:
+            raise AssertionError(f"{name} did not round-trip the walk")
+
+        size = path.stat().st_size / 1024
+        print(f"{name:<10}{size:>12.1f}{write_time * 1000:>12.1f}{read_time * 1000:>12.1f}")
+        path.unlink()
+
+
+def _time(func, *args) -> float:
+    """Return the time taken by one call of `func`, in seconds."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    benchmark()